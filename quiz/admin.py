@@ -1,7 +1,17 @@
+import csv
+import itertools
+
 from django.contrib import admin
+from django.http import StreamingHttpResponse
 from .models import Category, Question, Option, QuizAttempt, Answer
 
 
+class EchoBuffer:
+    """File-like object whose write() returns the value, for streaming csv rows"""
+    def write(self, value):
+        return value
+
+
 class OptionInline(admin.TabularInline):
     """Inline form to add options directly when creating/editing questions"""
     model = Option
@@ -30,6 +40,10 @@ class QuestionAdmin(admin.ModelAdmin):
         """Show first 100 characters of question text"""
         return obj.text[:100] + '...' if len(obj.text) > 100 else obj.text
     text_preview.short_description = 'Question'
+    
+    def get_queryset(self, request):
+        """Join the category shown in the list and in Question.__str__"""
+        return super().get_queryset(request).select_related('category')
 
 
 @admin.register(Option)
@@ -38,6 +52,10 @@ class OptionAdmin(admin.ModelAdmin):
     list_display = ('text', 'question', 'is_correct')
     list_filter = ('is_correct', 'question__category')
     search_fields = ('text', 'question__text')
+    
+    def get_queryset(self, request):
+        """Join the question and category rendered in the question column"""
+        return super().get_queryset(request).select_related('question__category')
 
 
 @admin.register(QuizAttempt)
@@ -47,11 +65,41 @@ class QuizAttemptAdmin(admin.ModelAdmin):
     list_filter = ('category', 'passed', 'started_at')
     search_fields = ('user__username', 'user__email')
     readonly_fields = ('score', 'passed', 'started_at', 'completed_at')
+    
+    def get_queryset(self, request):
+        """Join the user and category shown in the list and in QuizAttempt.__str__"""
+        return super().get_queryset(request).select_related('user', 'category')
 
 
 @admin.register(Answer)
 class AnswerAdmin(admin.ModelAdmin):
     """Admin interface for viewing user answers"""
-    list_display = ('attempt', 'question', 'is_flagged', 'answered_at')
-    list_filter = ('is_flagged', 'attempt__category')
-    readonly_fields = ('answered_at',)
+    list_display = ('attempt', 'question', 'is_correct', 'is_flagged', 'answered_at')
+    list_filter = ('is_correct', 'is_flagged', 'attempt__category')
+    readonly_fields = ('is_correct', 'answered_at')
+    actions = ['export_csv']
+    # Skip the extra unfiltered COUNT(*) over the whole answers table
+    show_full_result_count = False
+    
+    def get_queryset(self, request):
+        """Join the attempt user, attempt category and question category shown per answer"""
+        return super().get_queryset(request).select_related(
+            'attempt__user', 'attempt__category', 'question__category'
+        )
+    
+    def export_csv(self, request, queryset):
+        """Stream the selected answers as CSV straight from database rows"""
+        fields = (
+            'id', 'attempt_id', 'attempt__user__username', 'question_id',
+            'is_correct', 'is_flagged', 'answered_at',
+        )
+        # values_list + iterator avoids building model instances or holding all rows
+        rows = queryset.order_by('id').values_list(*fields).iterator(chunk_size=2000)
+        writer = csv.writer(EchoBuffer())
+        response = StreamingHttpResponse(
+            (writer.writerow(row) for row in itertools.chain([fields], rows)),
+            content_type='text/csv'
+        )
+        response['Content-Disposition'] = 'attachment; filename="answers.csv"'
+        return response
+    export_csv.short_description = 'Export selected answers to CSV'
@@ -4,6 +4,7 @@ Run with: python manage.py loaddemo
 """
 
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.contrib.auth.models import User
 from quiz.models import Category, Question, Option
 
@@ -30,20 +31,7 @@ class Command(BaseCommand):
             }
 ]
 
-        self.stdout.write('\nCreating categories...')
-        for cat_data in categories_data:
-            category, created = Category.objects.get_or_create(
-                name=cat_data['name'],
-                defaults={'description': cat_data['description']}
-            )
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'  Created: {category.name}'))
-            else:
-                self.stdout.write(f'  - Already exists: {category.name}')
-
         # Python Programming Questions
-        python_cat = Category.objects.get(name='Python Programming')
-
         python_questions = [
             {
                 'text': 'What is the output of print(2 ** 3)?',
@@ -97,28 +85,7 @@ class Command(BaseCommand):
             },
         ]
 
-        self.stdout.write('\nCreating Python questions...')
-        for q_data in python_questions:
-            question, created = Question.objects.get_or_create(
-                text=q_data['text'],
-                category=python_cat,
-                defaults={'question_type': q_data['type']}
-            )
-            
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'  Created question: {question.text[:50]}...'))
-                for option_text, is_correct in q_data['options']:
-                    Option.objects.create(
-                        question=question,
-                        text=option_text,
-                        is_correct=is_correct
-                    )
-            else:
-                self.stdout.write(f'  - Already exists: {question.text[:50]}...')
-
         # Web Development Questions
-        web_cat = Category.objects.get(name='Web Development')
-
         web_questions = [
             {
                 'text': 'What does HTML stand for?',
@@ -162,28 +129,7 @@ class Command(BaseCommand):
             },
         ]
 
-        self.stdout.write('\nCreating Web Development questions...')
-        for q_data in web_questions:
-            question, created = Question.objects.get_or_create(
-                text=q_data['text'],
-                category=web_cat,
-                defaults={'question_type': q_data['type']}
-            )
-            
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'  Created question: {question.text[:50]}...'))
-                for option_text, is_correct in q_data['options']:
-                    Option.objects.create(
-                        question=question,
-                        text=option_text,
-                        is_correct=is_correct
-                    )
-            else:
-                self.stdout.write(f'  - Already exists: {question.text[:50]}...')
-
         # General Knowledge Questions
-        gk_cat = Category.objects.get(name='General Knowledge')
-
         gk_questions = [
             {
                 'text': 'What is the capital of France?',
@@ -217,24 +163,65 @@ class Command(BaseCommand):
             },
         ]
 
-        self.stdout.write('\nCreating General Knowledge questions...')
-        for q_data in gk_questions:
-            question, created = Question.objects.get_or_create(
-                text=q_data['text'],
-                category=gk_cat,
-                defaults={'question_type': q_data['type']}
+        questions_data = [
+            ('Python Programming', 'Python', python_questions),
+            ('Web Development', 'Web Development', web_questions),
+            ('General Knowledge', 'General Knowledge', gk_questions),
+        ]
+
+        # Load everything in one transaction with one INSERT per model
+        with transaction.atomic():
+            self.stdout.write('\nCreating categories...')
+            existing_categories = set(
+                Category.objects.filter(
+                    name__in=[cat_data['name'] for cat_data in categories_data]
+                ).values_list('name', flat=True)
+            )
+            Category.objects.bulk_create(
+                [Category(**cat_data) for cat_data in categories_data
+                 if cat_data['name'] not in existing_categories],
+                ignore_conflicts=True
             )
-            
-            if created:
-                self.stdout.write(self.style.SUCCESS(f'  Created question: {question.text[:50]}...'))
-                for option_text, is_correct in q_data['options']:
-                    Option.objects.create(
-                        question=question,
-                        text=option_text,
-                        is_correct=is_correct
+            for cat_data in categories_data:
+                if cat_data['name'] in existing_categories:
+                    self.stdout.write(f'  - Already exists: {cat_data["name"]}')
+                else:
+                    self.stdout.write(self.style.SUCCESS(f'  Created: {cat_data["name"]}'))
+
+            categories = Category.objects.in_bulk(
+                [cat_data['name'] for cat_data in categories_data], field_name='name'
+            )
+
+            # Questions have no unique key, so skip the ones already loaded by text
+            # (including soft-deleted ones)
+            existing_questions = set(
+                Question.all_objects.filter(category__in=categories.values())
+                .values_list('category__name', 'text')
+            )
+
+            new_questions = []
+            for category_name, label, category_questions in questions_data:
+                self.stdout.write(f'\nCreating {label} questions...')
+                for q_data in category_questions:
+                    if (category_name, q_data['text']) in existing_questions:
+                        self.stdout.write(f'  - Already exists: {q_data["text"][:50]}...')
+                        continue
+                    question = Question(
+                        text=q_data['text'],
+                        category=categories[category_name],
+                        question_type=q_data['type']
                     )
-            else:
-                self.stdout.write(f'  - Already exists: {question.text[:50]}...')
+                    new_questions.append((question, q_data['options']))
+                    self.stdout.write(self.style.SUCCESS(f'  Created question: {question.text[:50]}...'))
+
+            # bulk_create sets primary keys on PostgreSQL and SQLite, so options can
+            # reference the new questions directly
+            Question.objects.bulk_create([question for question, _ in new_questions])
+            Option.objects.bulk_create([
+                Option(question=question, text=option_text, is_correct=is_correct)
+                for question, options_data in new_questions
+                for option_text, is_correct in options_data
+            ])
 
         # Create a demo user
         self.stdout.write('\nCreating demo user...')
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.18 on 2026-10-15 08:37
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['attempt', 'id'], name='quiz_answer_attempt_66b08c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='answer',
+            index=models.Index(fields=['attempt', 'is_flagged'], name='quiz_answer_attempt_5d1ba2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['category', 'is_deleted'], name='quiz_questi_categor_465e3c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='quizattempt',
+            index=models.Index(fields=['user', '-completed_at'], name='quiz_quizat_user_id_eabccb_idx'),
+        ),
+    ]
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.18 on 2026-10-15 08:38
+
+from django.db import migrations, models
+from django.db.models import Count, F, Q
+
+
+def backfill_is_correct(apps, schema_editor):
+    """Mark existing answers whose selected options match the correct options"""
+    Answer = apps.get_model('quiz', 'Answer')
+    correct_ids = Answer.objects.annotate(
+        num_selected=Count('selected_options', distinct=True),
+        num_selected_correct=Count(
+            'selected_options',
+            filter=Q(selected_options__is_correct=True),
+            distinct=True,
+        ),
+        num_correct_total=Count(
+            'question__options',
+            filter=Q(question__options__is_correct=True),
+            distinct=True,
+        ),
+    ).filter(
+        num_selected=F('num_selected_correct'),
+        num_selected_correct=F('num_correct_total'),
+    ).values('id')
+    # Filter by subquery so the ids never round-trip through Python
+    Answer.objects.filter(id__in=correct_ids).update(is_correct=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('quiz', '0002_add_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='answer',
+            name='is_correct',
+            field=models.BooleanField(default=False, help_text='Selected options match the correct options'),
+        ),
+        migrations.RunPython(backfill_is_correct, migrations.RunPython.noop),
+    ]
@@ -1,4 +1,6 @@
 from django.db import models
+from django.db.models import Case, Count, Exists, F, OuterRef, Q, Value, When
+from django.db.models.functions import Cast, Round
 from django.contrib.auth.models import User
 from django.utils import timezone
 
@@ -17,6 +19,18 @@ class Category(models.Model):
         return self.name
 
 
+class QuestionQuerySet(models.QuerySet):
+    def soft_delete(self):
+        """Soft delete every question in the queryset with a single UPDATE"""
+        return self.update(is_deleted=True, deleted_at=timezone.now())
+
+
+class ActiveQuestionManager(models.Manager.from_queryset(QuestionQuerySet)):
+    """Default manager that hides soft-deleted questions"""
+    def get_queryset(self):
+        return super().get_queryset().filter(is_deleted=False)
+
+
 class Question(models.Model):
     """Individual quiz question with multiple choice options"""
     QUESTION_TYPES = [
@@ -35,17 +49,34 @@ class Question(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
     
+    objects = ActiveQuestionManager()
+    all_objects = QuestionQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-created_at']
+        # Admin, dumpdata and related lookups should still see deleted questions
+        default_manager_name = 'all_objects'
+        indexes = [
+            # Partial index covering only live questions (PostgreSQL and SQLite)
+            models.Index(
+                fields=['category'],
+                condition=Q(is_deleted=False),
+                name='quiz_question_active_cat_idx'
+            ),
+        ]
     
     def __str__(self):
         return f"{self.category.name}: {self.text[:50]}..."
     
     def delete(self, *args, **kwargs):
         """Soft delete - mark as deleted instead of removing from database"""
-        self.is_deleted = True
         self.deleted_at = timezone.now()
-        self.save()
+        self.is_deleted = True
+        # Update only the soft delete columns rather than rewriting the whole row
+        type(self).all_objects.filter(pk=self.pk).update(
+            is_deleted=True,
+            deleted_at=self.deleted_at
+        )
 
 
 class Option(models.Model):
@@ -58,6 +89,39 @@ class Option(models.Model):
         return f"{self.text} ({'Correct' if self.is_correct else 'Incorrect'})"
 
 
+class QuizAttemptQuerySet(models.QuerySet):
+    def with_scores(self):
+        """
+        Annotate each attempt with num_answers, num_correct and computed_score
+        (percentage rounded to 2 places) in a single query; calculate_score
+        reads the same annotation for one attempt
+        """
+        return self.annotate(
+            num_answers=Count('answers', distinct=True),
+            num_correct=Count('answers', filter=Q(answers__is_correct=True), distinct=True),
+            computed_score=Case(
+                When(num_answers=0, then=Value(0.0)),
+                # Round casts to numeric on PostgreSQL, so cast back to a float
+                default=Cast(
+                    Round(F('num_correct') * Value(100.0) / F('num_answers'), 2),
+                    models.FloatField()
+                ),
+                output_field=models.FloatField(),
+            ),
+        )
+    
+    def regrade(self):
+        """Recalculate the stored score and passed result of each attempt from its answers"""
+        # Annotate a fresh queryset so filters across answers can't skew the counts
+        attempts = list(type(self)(self.model, using=self._db).filter(
+            pk__in=self.values('pk')
+        ).with_scores())
+        for attempt in attempts:
+            attempt.score = attempt.computed_score
+            attempt.passed = attempt.score >= attempt.passing_score
+        return self.model.objects.bulk_update(attempts, ['score', 'passed'])
+
+
 class QuizAttempt(models.Model):
     """Tracks each quiz attempt by a user"""
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='quiz_attempts')
@@ -76,21 +140,24 @@ class QuizAttempt(models.Model):
     started_at = models.DateTimeField(auto_now_add=True)
     completed_at = models.DateTimeField(null=True, blank=True)
     
+    objects = QuizAttemptQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-started_at']
+        indexes = [
+            models.Index(fields=['user', '-completed_at']),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.category.name} ({self.started_at.strftime('%Y-%m-%d')})"
     
     def calculate_score(self):
         """Calculate the percentage score for this attempt"""
-        total_answers = self.answers.count()
-        if total_answers == 0:
-            return 0
-        
-        correct_answers = sum(1 for answer in self.answers.all() if answer.is_correct())
-        percentage = (correct_answers / total_answers) * 100
-        return round(percentage, 2)
+        # Share the SQL formula used by QuizAttemptQuerySet.with_scores()
+        return (
+            type(self).objects.filter(pk=self.pk).with_scores()
+            .values_list('computed_score', flat=True).get()
+        )
     
     def submit_quiz(self):
         """Mark quiz as completed and calculate final score"""
@@ -100,27 +167,49 @@ class QuizAttempt(models.Model):
         self.save()
 
 
+class AnswerQuerySet(models.QuerySet):
+    def refresh_correctness(self):
+        """Recompute the stored is_correct flag for every answer in the queryset with one UPDATE"""
+        # Correct when every selected option is correct and every correct option is selected
+        correct = type(self)(self.model, using=self._db).filter(pk=OuterRef('pk')).annotate(
+            num_selected=Count('selected_options', distinct=True),
+            num_selected_correct=Count(
+                'selected_options',
+                filter=Q(selected_options__is_correct=True),
+                distinct=True,
+            ),
+            num_correct_total=Count(
+                'question__options',
+                filter=Q(question__options__is_correct=True),
+                distinct=True,
+            ),
+        ).filter(
+            num_selected=F('num_selected_correct'),
+            num_selected_correct=F('num_correct_total'),
+        )
+        return self.update(is_correct=Exists(correct))
+
+
 class Answer(models.Model):
     """User's answer for a specific question in a quiz attempt"""
     attempt = models.ForeignKey(QuizAttempt, on_delete=models.CASCADE, related_name='answers')
     question = models.ForeignKey(Question, on_delete=models.CASCADE)
     selected_options = models.ManyToManyField(Option, related_name='answers')
     is_flagged = models.BooleanField(default=False, help_text="User flagged for review")
+    # Single source of truth for answer correctness: set by question_view on save,
+    # refreshed (and submitted attempts regraded) by quiz.signals when options change
+    is_correct = models.BooleanField(default=False, help_text="Selected options match the correct options")
     
     answered_at = models.DateTimeField(auto_now=True)
     
+    objects = AnswerQuerySet.as_manager()
+    
     class Meta:
         unique_together = ['attempt', 'question']
+        indexes = [
+            models.Index(fields=['attempt', 'id']),
+            models.Index(fields=['attempt', 'is_flagged']),
+        ]
     
     def __str__(self):
         return f"{self.attempt.user.username} - Q{self.question.id}"
-    
-    def is_correct(self):
-        """Check if the answer is correct"""
-        # Get all correct options for the question
-        correct_options = set(self.question.options.filter(is_correct=True))
-        # Get selected options
-        selected = set(self.selected_options.all())
-        
-        # For answer to be correct, selected options must match correct options exactly
-        return correct_options == selected
@@ -0,0 +1,47 @@
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Answer, Category, Option, QuizAttempt
+
+# Cache key for the category list shown on the dashboard
+CATEGORY_LIST_CACHE_KEY = 'quiz:categories:v1'
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_category_list(sender, **kwargs):
+    """Drop this process's cached dashboard category list when a category changes"""
+    cache.delete(CATEGORY_LIST_CACHE_KEY)
+
+
+def regrade_question(question_id):
+    """Refresh is_correct for a question's answers and regrade submitted attempts using it"""
+    answers = Answer.objects.filter(question_id=question_id)
+    answers.refresh_correctness()
+    QuizAttempt.objects.filter(
+        completed_at__isnull=False,
+        id__in=answers.values('attempt_id')
+    ).regrade()
+
+
+@receiver(pre_save, sender=Option)
+def remember_option_correctness(sender, instance, **kwargs):
+    """Remember whether the option was correct before this save (None for new options)"""
+    instance._was_correct = (
+        sender.objects.filter(pk=instance.pk).values_list('is_correct', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=Option)
+def regrade_on_option_save(sender, instance, **kwargs):
+    """Regrade only when the save changed which options are correct"""
+    if instance.is_correct != bool(getattr(instance, '_was_correct', None)):
+        regrade_question(instance.question_id)
+
+
+@receiver(post_delete, sender=Option)
+def regrade_on_option_delete(sender, instance, **kwargs):
+    """Regrade after a delete, which may also drop the option from answers' selections"""
+    regrade_question(instance.question_id)
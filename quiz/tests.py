@@ -1,3 +1,162 @@
+from importlib import import_module
+
+from django.apps import apps
+from django.contrib.auth.models import User
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from .models import Answer, Category, Option, Question, QuizAttempt
+
+
+class AnswerCorrectnessTests(TestCase):
+    """Stored Answer.is_correct and the scores calculated from it"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('student', password='pass123')
+        self.client.login(username='student', password='pass123')
+
+        category = Category.objects.create(name='Python Programming')
+        self.single = Question.objects.create(category=category, text='2 ** 3?')
+        self.single_right = Option.objects.create(question=self.single, text='8', is_correct=True)
+        self.single_wrong = Option.objects.create(question=self.single, text='6')
+
+        self.multiple = Question.objects.create(
+            category=category, text='Mutable types?', question_type='multiple'
+        )
+        self.list_option = Option.objects.create(question=self.multiple, text='List', is_correct=True)
+        self.dict_option = Option.objects.create(question=self.multiple, text='Dict', is_correct=True)
+        Option.objects.create(question=self.multiple, text='Tuple')
+
+        self.attempt = QuizAttempt.objects.create(user=self.user, category=category, total_questions=2)
+        self.single_answer = Answer.objects.create(attempt=self.attempt, question=self.single)
+        self.multiple_answer = Answer.objects.create(attempt=self.attempt, question=self.multiple)
+
+    def post_answer(self, answer, options):
+        url = reverse('question_view', args=[self.attempt.id, answer.id])
+        response = self.client.post(url, {'options': [option.id for option in options]})
+        self.assertEqual(response.status_code, 200)
+        answer.refresh_from_db()
+
+    def test_unanswered_questions_score_zero(self):
+        self.assertFalse(self.single_answer.is_correct)
+        self.assertEqual(self.attempt.calculate_score(), 0)
+
+    def test_question_view_post_stores_correctness_used_by_score(self):
+        self.post_answer(self.single_answer, [self.single_right])
+        self.assertTrue(self.single_answer.is_correct)
+
+        # Only one of the two correct options selected
+        self.post_answer(self.multiple_answer, [self.list_option])
+        self.assertFalse(self.multiple_answer.is_correct)
+        self.assertEqual(self.attempt.calculate_score(), 50)
+
+        self.post_answer(self.multiple_answer, [self.list_option, self.dict_option])
+        self.assertTrue(self.multiple_answer.is_correct)
+        self.assertEqual(self.attempt.calculate_score(), 100)
+
+    def test_option_changes_refresh_stored_correctness(self):
+        self.post_answer(self.single_answer, [self.single_right])
+
+        self.single_wrong.is_correct = True
+        self.single_wrong.save()
+        self.single_answer.refresh_from_db()
+        self.assertFalse(self.single_answer.is_correct)
+
+        self.single_wrong.delete()
+        self.single_answer.refresh_from_db()
+        self.assertTrue(self.single_answer.is_correct)
+
+    def test_option_changes_regrade_submitted_attempts(self):
+        self.post_answer(self.single_answer, [self.single_right])
+        self.post_answer(self.multiple_answer, [self.list_option, self.dict_option])
+        self.attempt.submit_quiz()
+        self.assertEqual(self.attempt.score, 100)
+        self.assertTrue(self.attempt.passed)
+
+        self.single_wrong.is_correct = True
+        self.single_wrong.save()
+        self.attempt.refresh_from_db()
+        self.assertEqual(self.attempt.score, 50)
+        self.assertFalse(self.attempt.passed)
+
+        response = self.client.get(reverse('quiz_results', args=[self.attempt.id]))
+        self.assertEqual(response.context['attempt'].score, 50)
+        self.assertEqual([r['is_correct'] for r in response.context['results']].count(False), 1)
+
+    def test_option_saves_that_keep_correctness_skip_the_refresh(self):
+        self.post_answer(self.single_answer, [self.single_right])
+        with CaptureQueriesContext(connection) as queries:
+            self.single_right.text = 'Eight'
+            self.single_right.save()
+            Option.objects.create(question=self.single, text='9')
+        self.assertFalse(any('"quiz_answer"' in q['sql'] for q in queries.captured_queries))
+
+    def test_backfill_marks_existing_correct_answers(self):
+        self.single_answer.selected_options.set([self.single_right])
+        self.multiple_answer.selected_options.set([self.list_option])
+        Answer.objects.update(is_correct=False)
+
+        migration = import_module('quiz.migrations.0003_answer_is_correct')
+        migration.backfill_is_correct(apps, None)
+
+        self.single_answer.refresh_from_db()
+        self.multiple_answer.refresh_from_db()
+        self.assertTrue(self.single_answer.is_correct)
+        self.assertFalse(self.multiple_answer.is_correct)
+
+
+class ToggleFlagTests(TestCase):
+    """Flagging answers for review"""
+
+    def setUp(self):
+        self.user = User.objects.create_user('student', password='pass123')
+        category = Category.objects.create(name='General Knowledge')
+        question = Question.objects.create(category=category, text='Capital of France?')
+        attempt = QuizAttempt.objects.create(user=self.user, category=category, total_questions=1)
+        self.answer = Answer.objects.create(attempt=attempt, question=question)
+        self.url = reverse('toggle_flag', args=[self.answer.id])
+
+    def test_toggle_round_trip(self):
+        self.client.login(username='student', password='pass123')
+        self.assertEqual(self.client.post(self.url).json(), {'flagged': True})
+        self.assertEqual(self.client.post(self.url).json(), {'flagged': False})
+
+    def test_toggle_leaves_answered_at_unchanged(self):
+        self.client.login(username='student', password='pass123')
+        answered_at = self.answer.answered_at
+        self.client.post(self.url)
+        self.answer.refresh_from_db()
+        self.assertTrue(self.answer.is_flagged)
+        self.assertEqual(self.answer.answered_at, answered_at)
+
+    def test_other_users_cannot_flag(self):
+        User.objects.create_user('intruder', password='pass123')
+        self.client.login(username='intruder', password='pass123')
+        self.assertEqual(self.client.post(self.url).status_code, 404)
+        self.answer.refresh_from_db()
+        self.assertFalse(self.answer.is_flagged)
+
+
+class AttemptScoreTests(TestCase):
+    """QuizAttemptQuerySet.with_scores() and calculate_score share one formula"""
+
+    def setUp(self):
+        user = User.objects.create_user('student', password='pass123')
+        category = Category.objects.create(name='General Knowledge')
+        questions = [
+            Question.objects.create(category=category, text=f'Question {i}') for i in range(3)
+        ]
+        self.empty = QuizAttempt.objects.create(user=user, category=category, total_questions=0)
+        self.partial = QuizAttempt.objects.create(user=user, category=category, total_questions=3)
+        for question, is_correct in zip(questions, [True, False, False]):
+            Answer.objects.create(attempt=self.partial, question=question, is_correct=is_correct)
+
+    def test_with_scores_matches_calculate_score(self):
+        for attempt in QuizAttempt.objects.with_scores():
+            self.assertEqual(attempt.computed_score, attempt.calculate_score())
 
-# Create your tests here.
+    def test_scores(self):
+        self.assertEqual(self.empty.calculate_score(), 0)
+        self.assertEqual(self.partial.calculate_score(), 33.33)
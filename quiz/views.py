@@ -2,11 +2,14 @@ from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib.auth.decorators import login_required
 from django.contrib.auth import authenticate, login, logout
 from django.contrib import messages
-from django.http import JsonResponse
-from django.db.models import Q
+from django.http import Http404, JsonResponse
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, F, OuterRef, Q
 import random
 
-from .models import Category, Question, QuizAttempt, Answer, Option
+from .models import Category, Question, QuizAttempt, Answer
+from .signals import CATEGORY_LIST_CACHE_KEY
 
 
 def login_view(request):
@@ -38,10 +41,17 @@ def logout_view(request):
 @login_required
 def dashboard(request):
     """User dashboard showing available categories and recent attempts"""
-    categories = Category.objects.all()
+    # Categories rarely change, so cache them briefly (invalidation is per-process)
+    categories = cache.get_or_set(
+        CATEGORY_LIST_CACHE_KEY,
+        lambda: list(Category.objects.values('id', 'name', 'description')),
+        300
+    )
     recent_attempts = QuizAttempt.objects.filter(
         user=request.user,
         completed_at__isnull=False
+    ).select_related('category').only(
+        'id', 'category__name', 'score', 'passed', 'completed_at'
     ).order_by('-completed_at')[:5]
     
     context = {
@@ -52,23 +62,24 @@ def dashboard(request):
 
 
 @login_required
+@transaction.atomic
 def start_quiz(request, category_id):
     """Start a new quiz for the selected category"""
     category = get_object_or_404(Category, id=category_id)
     
-    # Get random questions from this category (not deleted)
-    all_questions = list(Question.objects.filter(
-        category=category,
-        is_deleted=False
-    ))
+    # Get ids of questions in this category (the default manager skips deleted
+    # ones) - only ids cross the wire
+    question_ids = list(Question.objects.filter(
+        category=category
+    ).values_list('id', flat=True))
     
-    if len(all_questions) == 0:
+    if len(question_ids) == 0:
         messages.error(request, f'No questions available for {category.name}')
         return redirect('dashboard')
     
     # Randomly select up to 10 questions
-    num_questions = min(10, len(all_questions))
-    selected_questions = random.sample(all_questions, num_questions)
+    num_questions = min(10, len(question_ids))
+    selected_question_ids = random.sample(question_ids, num_questions)
     
     # Create quiz attempt
     attempt = QuizAttempt.objects.create(
@@ -77,12 +88,11 @@ def start_quiz(request, category_id):
         total_questions=num_questions
     )
     
-    # Create Answer objects for each question
-    for question in selected_questions:
-        Answer.objects.create(
-            attempt=attempt,
-            question=question
-        )
+    # Create Answer objects for each question in a single INSERT
+    Answer.objects.bulk_create([
+        Answer(attempt=attempt, question_id=question_id)
+        for question_id in selected_question_ids
+    ])
     
     return redirect('take_quiz', attempt_id=attempt.id)
 
@@ -96,8 +106,8 @@ def take_quiz(request, attempt_id):
     if attempt.completed_at:
         return redirect('quiz_results', attempt_id=attempt.id)
     
-    # Get all answers for this attempt with their questions
-    answers = (
+    # Get all answers for this attempt with their questions (evaluated once)
+    answers = list(
         attempt.answers.all()
         .select_related('question')
         .prefetch_related('selected_options', 'question__options')
@@ -105,13 +115,13 @@ def take_quiz(request, attempt_id):
     )
     
     # Get current question (first unanswered or first one)
-    current_answer = answers.first()
+    current_answer = answers[0] if answers else None
     
     context = {
         'attempt': attempt,
         'answers': answers,
         'current_answer': current_answer,
-        'total_questions': answers.count(),
+        'total_questions': attempt.total_questions,
     }
     return render(request, 'quiz/take_quiz.html', context)
 
@@ -120,26 +130,39 @@ def take_quiz(request, attempt_id):
 def question_view(request, attempt_id, answer_id):
     """Display a specific question (HTMX target)"""
     attempt = get_object_or_404(QuizAttempt, id=attempt_id, user=request.user)
-    answer = get_object_or_404(Answer, id=answer_id, attempt=attempt)
+    # Annotate whether any option is selected so GET needs no extra query
+    answer = get_object_or_404(
+        Answer.objects.annotate(
+            has_selection=Exists(
+                Answer.selected_options.through.objects.filter(answer_id=OuterRef('pk'))
+            )
+        ),
+        id=answer_id,
+        attempt=attempt
+    )
     
-    # Build next/previous navigation
-    ordered_ids = list(
-        Answer.objects.filter(attempt=attempt).order_by('id').values_list('id', flat=True)
+    # Build next/previous navigation from the neighbouring answer ids
+    prev_id = (
+        Answer.objects.filter(attempt=attempt, id__lt=answer.id)
+        .order_by('-id').values_list('id', flat=True).first()
+    )
+    next_id = (
+        Answer.objects.filter(attempt=attempt, id__gt=answer.id)
+        .order_by('id').values_list('id', flat=True).first()
     )
-    idx = ordered_ids.index(answer.id)
-    prev_id = ordered_ids[idx - 1] if idx > 0 else None
-    next_id = ordered_ids[idx + 1] if idx < len(ordered_ids) - 1 else None
     
     if request.method == 'POST':
-        # Save answer
-        selected_option_ids = request.POST.getlist('options')
-        answer.selected_options.clear()
-        for option_id in selected_option_ids:
-            option = Option.objects.get(id=option_id)
-            answer.selected_options.add(option)
-        answer.save()
-
-    has_selection = answer.selected_options.exists()
+        # Save answer - set() diffs against current selection by primary key
+        option_ids = [int(option_id) for option_id in request.POST.getlist('options')]
+        answer.selected_options.set(option_ids)
+        # Selected options must match the correct options exactly
+        correct_ids = set(
+            answer.question.options.filter(is_correct=True).values_list('id', flat=True)
+        )
+        answer.is_correct = set(option_ids) == correct_ids
+        # Only touch the changed columns rather than rewriting the whole row
+        answer.save(update_fields=['is_correct', 'answered_at'])
+        answer.has_selection = bool(option_ids)
 
     context = {
         'attempt': attempt,
@@ -147,9 +170,9 @@ def question_view(request, attempt_id, answer_id):
         'question': answer.question,
         'prev_id': prev_id,
         'next_id': next_id,
-        'is_first': idx == 0,
-        'is_last': idx == len(ordered_ids) - 1,
-        'has_selection': has_selection,
+        'is_first': prev_id is None,
+        'is_last': next_id is None,
+        'has_selection': answer.has_selection,
     }
     return render(request, 'quiz/question_view.html', context)
 
@@ -157,18 +180,24 @@ def question_view(request, attempt_id, answer_id):
 @login_required
 def toggle_flag(request, answer_id):
     """Toggle flag status for a question (HTMX)"""
-    answer = get_object_or_404(Answer, id=answer_id)
-    answer.is_flagged = not answer.is_flagged
-    answer.save()
+    # Flip the flag in a single UPDATE so answered_at is left untouched
+    answers = Answer.objects.filter(id=answer_id, attempt__user=request.user)
+    if not answers.update(is_flagged=~F('is_flagged')):
+        raise Http404('Answer not found')
     
-    return JsonResponse({'flagged': answer.is_flagged})
+    return JsonResponse({'flagged': answers.values_list('is_flagged', flat=True).get()})
 
 
 @login_required
 def review_panel(request, attempt_id):
     """Review panel showing all questions status (HTMX target)"""
     attempt = get_object_or_404(QuizAttempt, id=attempt_id, user=request.user)
-    answers = attempt.answers.all().select_related('question').prefetch_related('selected_options')
+    answers = (
+        attempt.answers.all()
+        .select_related('question')
+        .prefetch_related('selected_options')
+        .only('id', 'attempt', 'is_flagged', 'question__id', 'question__text')
+    )
     
     context = {
         'attempt': attempt,
@@ -204,14 +233,15 @@ def quiz_results(request, attempt_id):
     # Build results list with correct/incorrect info
     results = []
     for answer in answers:
-        correct_options = answer.question.options.filter(is_correct=True)
+        # Work from the prefetched options instead of re-querying per answer
+        correct_options = [o for o in answer.question.options.all() if o.is_correct]
         selected_options = answer.selected_options.all()
         
         results.append({
             'question': answer.question,
             'selected_options': selected_options,
             'correct_options': correct_options,
-            'is_correct': answer.is_correct(),
+            'is_correct': answer.is_correct,
         })
     
     context = {